@@ -178,7 +178,7 @@ use_miniconda3_in_temp_for_conda_if_necessary() {
         cd $my_tmp_dir
         url="https://repo.anaconda.com/miniconda/Miniconda3-latest-$plat-x86_64.sh"
         info "fetching $url"
-        curl "$url" -o installer.sh
+        curl --fail --connect-timeout 30 "$url" -o installer.sh
         bash installer.sh -bp ./miniconda
         CONDA=$my_tmp_dir/miniconda/condabin/conda
         dump_var CONDA
@@ -22,6 +22,11 @@ DEFS_DIR = RESOURCES_DIR / "defs"
 BIN_SOURCE_DIR = RESOURCES_DIR / "bin"
 ETC_SOURCE_DIR = RESOURCES_DIR / "etc"
 
+# Distinct exit statuses so callers can tell failures apart.
+EXIT_MAMBA_MISSING = 2
+EXIT_TARGET_NOT_DIRECTORY = 3
+EXIT_PRODUCTION_PROTECTION = 4
+
 
 def deploy_tier(
     target: Path,
@@ -36,7 +41,7 @@ def deploy_tier(
     tier_path = setup_tier_path(target, tier)
     if tier_path == prod_path:
         critical(f"attempt to modify {prod_path=}")
-        exit(4)
+        exit(EXIT_PRODUCTION_PROTECTION)
     keep = mode == "keep"
     if tier_path.exists() and not keep:
         if match(r"^(dev.*|test.*|staging)$", tier) or mode == "force":
@@ -58,7 +63,7 @@ def check_mamba():
     info(f"{MAMBA=}")
     if not MAMBA.is_file():
         critical(f"mamba is missing")
-        exit(2)
+        exit(EXIT_MAMBA_MISSING)
 
 
 def setup_tier_path(target, tier):
@@ -66,7 +71,7 @@ def setup_tier_path(target, tier):
     info(f"{tier=}")
     if not target.is_dir():
         critical("target is not a directory")
-        exit(3)
+        exit(EXIT_TARGET_NOT_DIRECTORY)
     tier_path = (target / "infrastructure" / tier).resolve()
     info(f"{tier_path=}")
     if not tier_path.is_dir():
@@ -75,13 +80,15 @@ def setup_tier_path(target, tier):
 
 
 def list_conda_environment_defs() -> list[Path]:
-    worklist = sorted(DEFS_DIR.glob("universal/*.yaml"))
+    candidates = sorted(DEFS_DIR.glob("universal/*.yaml"))
     if platform == "darwin":
-        worklist.append(DEFS_DIR / "mac/mac.yaml")
-    for item in worklist:
-        if not item.is_file():
+        candidates.append(DEFS_DIR / "mac/mac.yaml")
+    worklist = []
+    for item in candidates:
+        if item.is_file():
+            worklist.append(item)
+        else:
             error(f"not a file: {item}")
-            worklist.remove(item)
     debug(f"{worklist=}")
     return worklist
 